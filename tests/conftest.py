@@ -0,0 +1,33 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tradestation.tradestation import TradeStation
+
+
+@pytest.fixture
+def make_client():
+    """
+    Returns a factory for authenticated clients whose requests are answered by `handler` instead of the API.
+    Inside a running event loop, the async client is bound to that loop as well.
+    """
+    clients = []
+
+    def make(handler, **kwargs) -> TradeStation:
+        ts = TradeStation(client_id="client_id", client_secret="client_secret", authenticate=False, **kwargs)
+        ts.access_token = "token"
+        transport = httpx.MockTransport(handler)
+        ts._client = httpx.Client(transport=transport, base_url=ts.api_url)
+        try:
+            ts._aclient_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            ts._aclient = httpx.AsyncClient(transport=transport, base_url=ts.api_url)
+        clients.append(ts)
+        return ts
+
+    yield make
+    for ts in clients:
+        ts.close()
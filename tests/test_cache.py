@@ -0,0 +1,116 @@
+import httpx
+import pytest
+
+from tradestation import tradestation
+from tradestation.tradestation import CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTLS
+
+
+class CountingServer:
+    """Answers every request with a new response number, so tests can tell cached and fresh responses apart."""
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status_code, json={"Response": len(self.requests), "Items": [1, 2]})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the monotonic clock used for cache expiry with one the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(tradestation.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_cached_endpoint_is_reused_until_its_ttl_expires(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server, cache_ttls=DEFAULT_CACHE_TTLS)
+
+    assert ts.get_accounts()["Response"] == 1
+    assert ts.get_accounts()["Response"] == 1
+    clock[0] += DEFAULT_CACHE_TTLS["brokerage/accounts"]
+    assert ts.get_accounts()["Response"] == 2
+    assert len(server.requests) == 2
+
+
+def test_endpoints_without_a_ttl_are_not_cached(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server)
+
+    ts.get_accounts()
+    ts.get_accounts()
+
+    assert len(server.requests) == 2
+
+
+def test_mutating_a_response_does_not_change_the_cache(make_client, clock):
+    ts = make_client(CountingServer())
+
+    ts.get_routes()["Items"].clear()
+
+    assert ts.get_routes() == {"Response": 1, "Items": [1, 2]}
+
+
+def test_failed_responses_are_not_cached(make_client, clock):
+    server = CountingServer(status_code=500)
+    ts = make_client(server)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            ts.get_routes()
+
+    assert len(server.requests) == 2
+
+
+def test_refresh_routes_drops_only_static_entries(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server, cache_ttls=DEFAULT_CACHE_TTLS)
+    ts.get_routes()
+    ts.get_accounts()
+
+    ts.refresh_routes()
+
+    assert ts.get_routes()["Response"] == 3
+    assert ts.get_accounts()["Response"] == 2
+
+
+def test_clear_cache_drops_every_entry(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server, cache_ttls=DEFAULT_CACHE_TTLS)
+    ts.get_routes()
+    ts.get_accounts()
+
+    ts.clear_cache()
+    ts.get_routes()
+    ts.get_accounts()
+
+    assert len(server.requests) == 4
+
+
+def test_oldest_entries_are_evicted_beyond_the_limit(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server, cache_ttls=DEFAULT_CACHE_TTLS)
+
+    for page in range(CACHE_MAX_ENTRIES + 1):
+        ts._send_request("brokerage/accounts", params={"page": page})
+
+    assert len(ts._cache) == CACHE_MAX_ENTRIES
+    ts._send_request("brokerage/accounts", params={"page": CACHE_MAX_ENTRIES})
+    assert len(server.requests) == CACHE_MAX_ENTRIES + 1
+    ts._send_request("brokerage/accounts", params={"page": 0})
+    assert len(server.requests) == CACHE_MAX_ENTRIES + 2
+
+
+@pytest.mark.asyncio
+async def test_async_requests_share_the_cache(make_client, clock):
+    server = CountingServer()
+    ts = make_client(server)
+
+    assert ts.get_routes()["Response"] == 1
+    response = await ts.aget_routes()
+    response["Items"].append(3)
+
+    assert (await ts.aget_routes()) == {"Response": 1, "Items": [1, 2]}
+    assert len(server.requests) == 1
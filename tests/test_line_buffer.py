@@ -0,0 +1,46 @@
+import httpx
+
+from tradestation.tradestation import _LineBuffer
+
+
+def test_splits_lines_across_chunks():
+    buffer = _LineBuffer()
+
+    assert buffer.feed(b'{"a": 1}\n{"b"') == [b'{"a": 1}']
+    assert buffer.feed(b': 2}\n') == [b'{"b": 2}']
+    assert buffer.flush() is None
+
+
+def test_skips_blank_lines_and_strips_carriage_returns():
+    buffer = _LineBuffer()
+
+    assert buffer.feed(b'\r\n{"a": 1}\r\n\n  \n{"b": 2}\r\n') == [b'{"a": 1}', b'{"b": 2}']
+
+
+def test_flush_returns_the_unterminated_record():
+    buffer = _LineBuffer()
+
+    assert buffer.feed(b'{"a": 1}\n{"b": 2}') == [b'{"a": 1}']
+    assert buffer.flush() == b'{"b": 2}'
+    assert buffer.flush() is None
+
+
+def test_many_records_fed_byte_by_byte():
+    records = [f'{{"Id": {i}}}'.encode() for i in range(200)]
+    stream = b"\n".join(records) + b"\n"
+    buffer = _LineBuffer()
+
+    lines = []
+    for i in range(len(stream)):
+        lines += buffer.feed(stream[i:i + 1])
+
+    assert lines == records
+    assert buffer.flush() is None
+
+
+def test_stream_request_yields_records_split_across_chunks(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter([b'{"Id": 1}\n{"Id"', b': 2}\n{"Heart', b'beat": 1}']))
+    ts = make_client(handler)
+
+    assert list(ts._stream_request("brokerage/stream/accounts/123/orders")) == [{"Id": 1}, {"Id": 2}, {"Heartbeat": 1}]
@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from tradestation.tradestation import ORDER_BATCH_SIZE, Order
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_order(symbol: str) -> Order:
+    return Order(account_id="123", symbol=symbol, quantity="1", order_type="Market", trade_action="BUY",
+                 time_in_force_duration="DAY")
+
+
+class GroupOrderServer:
+    """Answers group order requests with `respond(orders)` and records the symbols of every group received."""
+    def __init__(self, respond):
+        self.respond = respond
+        self.groups = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/brokerage/accounts/ordergroups")
+        body = orjson.loads(request.content)
+        assert body["Type"] == "NORMAL"
+        symbols = [order["Symbol"] for order in body["Orders"]]
+        self.groups.append(symbols)
+        return self.respond(symbols)
+
+
+def accept_all(symbols):
+    return httpx.Response(200, json={"Orders": [{"OrderID": symbol, "Message": "Sent"} for symbol in symbols]})
+
+
+async def test_each_order_gets_its_own_entry(make_client):
+    server = GroupOrderServer(accept_all)
+    ts = make_client(server)
+
+    results = await asyncio.gather(*(ts.aplace_order_batched(make_order(symbol)) for symbol in ("A", "B", "C")))
+
+    assert server.groups == [["A", "B", "C"]]
+    assert results == [{"Orders": [{"OrderID": symbol, "Message": "Sent"}]} for symbol in ("A", "B", "C")]
+
+
+async def test_each_rejected_order_raises_its_own_error(make_client):
+    server = GroupOrderServer(lambda symbols: httpx.Response(
+        200, json={"Errors": [{"Error": "FAILED", "Message": f"rejected {symbol}"} for symbol in symbols]}))
+    ts = make_client(server)
+
+    results = await asyncio.gather(*(ts.aplace_order_batched(make_order(symbol)) for symbol in ("A", "B")),
+                                   return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "rejected A" in str(results[0]) and "rejected B" not in str(results[0])
+    assert "rejected B" in str(results[1])
+
+
+async def test_mixed_response_fails_every_order(make_client):
+    server = GroupOrderServer(lambda symbols: httpx.Response(
+        200, json={"Orders": [{"OrderID": symbols[0]}], "Errors": [{"Error": "FAILED", "Message": "rejected"}]}))
+    ts = make_client(server)
+
+    results = await asyncio.gather(*(ts.aplace_order_batched(make_order(symbol)) for symbol in ("A", "B")),
+                                   return_exceptions=True)
+
+    for result in results:
+        assert isinstance(result, ValueError)
+        assert "some orders may have been placed" in str(result)
+
+
+async def test_failed_group_request_fails_every_order(make_client):
+    server = GroupOrderServer(lambda symbols: httpx.Response(400, text="bad request"))
+    ts = make_client(server)
+
+    results = await asyncio.gather(*(ts.aplace_order_batched(make_order(symbol)) for symbol in ("A", "B")),
+                                   return_exceptions=True)
+
+    assert len(server.groups) == 1
+    assert all(isinstance(result, ValueError) and "bad request" in str(result) for result in results)
+
+
+async def test_large_burst_is_split_into_full_batches(make_client):
+    server = GroupOrderServer(accept_all)
+    ts = make_client(server)
+    symbols = [f"S{i}" for i in range(2 * ORDER_BATCH_SIZE + 20)]
+
+    results = await asyncio.gather(*(ts.aplace_order_batched(make_order(symbol)) for symbol in symbols))
+
+    assert [len(group) for group in server.groups] == [ORDER_BATCH_SIZE, ORDER_BATCH_SIZE, 20]
+    assert [result["Orders"][0]["OrderID"] for result in results] == symbols
+
+
+async def test_orders_after_a_flush_start_a_new_batch(make_client):
+    server = GroupOrderServer(accept_all)
+    ts = make_client(server)
+
+    first = await ts.aplace_order_batched(make_order("A"))
+    second = await ts.aplace_order_batched(make_order("B"))
+
+    assert server.groups == [["A"], ["B"]]
+    assert first["Orders"][0]["OrderID"] == "A"
+    assert second["Orders"][0]["OrderID"] == "B"
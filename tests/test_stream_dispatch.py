@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from tradestation.tradestation import STREAM_QUEUE_SIZE, _adispatch_stream
+
+pytestmark = pytest.mark.asyncio
+
+
+class Messages:
+    """An async stream of messages that records whether the dispatcher closed it."""
+    def __init__(self, messages):
+        self.messages = messages
+        self.closed = False
+
+    async def __aiter__(self):
+        try:
+            for message in self.messages:
+                yield message
+        finally:
+            self.closed = True
+
+
+def positions(count: int) -> list:
+    return [{"PositionID": str(i)} for i in range(count)]
+
+
+async def test_messages_are_routed_in_order():
+    events = []
+    stream = Messages([{"Heartbeat": 1}, {"PositionID": "1"}, {"Error": "Failed"}, {"StreamStatus": "EndSnapshot"},
+                       {"PositionID": "2", "Deleted": True}, {}])
+
+    async def on_data(data):
+        await asyncio.sleep(0)
+        events.append(("data", data))
+
+    await _adispatch_stream(stream.__aiter__(), on_data, lambda data: events.append(("error", data)),
+                            lambda data: events.append(("heartbeat", data)), lambda data: events.append(("status", data)))
+
+    assert [kind for kind, _ in events] == ["heartbeat", "data", "error", "status", "data", "error"]
+    assert events[-1][1]["Error"] == "InvalidData"
+
+
+async def test_missing_handlers_are_skipped():
+    data = []
+    stream = Messages([{"Heartbeat": 1}, {"Error": "Failed"}, {"PositionID": "1"}])
+
+    await _adispatch_stream(stream.__aiter__(), data.append, None, None, None)
+
+    assert data == [{"PositionID": "1"}]
+
+
+async def test_slow_handlers_drop_the_oldest_messages_and_get_one_notice():
+    events = []
+    count = 3 * STREAM_QUEUE_SIZE
+
+    async def on_data(data):
+        if data["PositionID"] == "0":
+            # Stall long enough for the reader to overflow the queue
+            await asyncio.sleep(0.01)
+        events.append(data)
+
+    await _adispatch_stream(Messages(positions(count)).__aiter__(), on_data, events.append, None, None)
+
+    notices = [i for i, event in enumerate(events) if event.get("Error") == "Backpressure"]
+    ids = [int(event["PositionID"]) for event in events if "PositionID" in event]
+    assert notices == [1]
+    assert ids[0] == 0 and ids[-1] == count - 1
+    assert ids == sorted(ids) and len(ids) <= STREAM_QUEUE_SIZE + 1
+
+
+async def test_without_dropping_every_message_is_delivered():
+    data, errors = [], []
+    count = 3 * STREAM_QUEUE_SIZE
+
+    async def on_data(message):
+        if message["PositionID"] == "0":
+            await asyncio.sleep(0.01)
+        data.append(message)
+
+    await _adispatch_stream(Messages(positions(count)).__aiter__(), on_data, errors.append, None, None,
+                            drop_oldest=False)
+
+    assert data == positions(count)
+    assert errors == []
+
+
+@pytest.mark.parametrize("drop_oldest", [True, False])
+async def test_handler_errors_end_the_stream(drop_oldest):
+    stream = Messages(positions(3 * STREAM_QUEUE_SIZE))
+
+    async def on_data(data):
+        await asyncio.sleep(0.001)
+        raise RuntimeError("handler failed")
+
+    with pytest.raises(RuntimeError, match="handler failed"):
+        await asyncio.wait_for(_adispatch_stream(stream.__aiter__(), on_data, None, None, None, drop_oldest=drop_oldest), 5)
+    assert stream.closed
+
+
+async def test_order_streams_do_not_drop_by_default(make_client):
+    count = 3 * STREAM_QUEUE_SIZE
+    body = b"".join(orjson.dumps({"OrderID": str(i)}) + b"\n" for i in range(count))
+    ts = make_client(lambda request: httpx.Response(200, content=body))
+    data, errors = [], []
+
+    async def on_data(order):
+        if order["OrderID"] == "0":
+            await asyncio.sleep(0.01)
+        data.append(order["OrderID"])
+
+    await ts.astream_orders("123", data_handler=on_data, error_handler=errors.append)
+
+    assert data == [str(i) for i in range(count)]
+    assert errors == []
@@ -1,8 +1,10 @@
-from .tradestation import Order, TradeStation
+from .tradestation import Order, StreamEvent, TradeStation, install_fast_loop
 
 __version__ = "0.1.0"
 
 __all__ = [
     "Order",
-    "TradeStation"
+    "StreamEvent",
+    "TradeStation",
+    "install_fast_loop"
 ]
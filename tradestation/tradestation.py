@@ -1,19 +1,42 @@
 import os
+import atexit
 import webbrowser
-from urllib.parse import urlencode, urlparse, parse_qs
+from urllib.parse import urlencode, urlparse, parse_qs, quote
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from datetime import datetime, timedelta, timezone
-from typing import Literal, Optional, Union, List, Generator, AsyncGenerator
-import json
+from typing import Literal, Optional, Union, List, Tuple, Generator, AsyncGenerator, NamedTuple
+import orjson
 import httpx
 import asyncio
-from aiohttp import web
+import inspect
 import threading
+import time
+import weakref
+from functools import lru_cache
+from types import MappingProxyType
 
 AUTH_URL = "https://signin.tradestation.com/authorize"
 TOKEN_URL = "https://signin.tradestation.com/oauth/token"
 LIVE_API_URL = "https://api.tradestation.com/v3"
 DEMO_API_URL = "https://sim-api.tradestation.com/v3"
+AUTH_TIMEOUT = 120
+HTTP_TIMEOUT = httpx.Timeout(10.0)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
+HTTP_RETRIES = 3
+REFRESH_RETRY_DELAY = 10
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_QUEUE_SIZE = 1024
+CACHE_MAX_ENTRIES = 512
+KEEPALIVE_ENDPOINT = "brokerage/accounts/routes"
+ORDER_BATCH_WAIT = 0.005
+ORDER_BATCH_SIZE = 50
+MAX_IDS_PER_REQUEST = 50
+DEFAULT_CACHE_TTLS = MappingProxyType({"brokerage/accounts": 30.0})
+# Server-side configuration that does not change intraday, cached unless overridden through `cache_ttls`
+STATIC_CACHE_TTLS = MappingProxyType({"brokerage/accounts/routes": 3600.0, "brokerage/accounts/activationtriggers": 3600.0})
+BAR_COLUMNS = ("TimeStamp", "Open", "High", "Low", "Close", "TotalVolume")
+BAR_UNITS = frozenset(("Minute", "Daily", "Weekly", "Monthly"))
+SESSION_TEMPLATES = frozenset(("USEQPre", "USEQPost", "USEQPreAndPost", "USEQ24Hour", "Default"))
 auth_success_html = """
 <!DOCTYPE html>
 <html lang="en">
@@ -44,6 +67,16 @@ auth_success_html = """
 </html>
 """
 
+def _http_response(status: str, content_type: str, body: bytes) -> bytes:
+    """Builds a complete HTTP/1.1 response for the OAuth callback listener."""
+    head = f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    return head.encode("latin-1") + body
+
+# Complete callback responses, built once so either listener answers with a single write
+_AUTH_OK = _http_response("200 OK", "text/html; charset=utf-8", auth_success_html.encode("utf-8"))
+_AUTH_FAILED = _http_response("500 Internal Server Error", "text/plain", b"Authentication failed.")
+_AUTH_NO_CODE = _http_response("400 Bad Request", "text/plain", b"No authorization code found.")
+
 class OAuthHandler(BaseHTTPRequestHandler):
     """Handles OAuth authentication callback from TradeStation."""
     access_token = None
@@ -54,23 +87,269 @@ class OAuthHandler(BaseHTTPRequestHandler):
         query_params = parse_qs(parsed_url.query)
 
         if 'code' not in query_params:
-            self.send_error(400, "Error: No code received")
+            self.wfile.write(_AUTH_NO_CODE)
             return
 
-        self.send_response(200)
-        self.end_headers()
-        # with open("auth_success.html", 'rb') as f:
-        #     self.wfile.write(f.read())
-        self.wfile.write(auth_success_html.encode('utf-8'))
-        # Exchange code for token
-        code = query_params['code'][0]
-        self.server.auth_instance._exchange_code_for_token(code)
-
-        # Stop the server
-        threading.Thread(target=self.server.shutdown).start()
+        # Exchange code for token before answering, so the browser is only told about a successful login
+        auth_instance = self.server.auth_instance
+        try:
+            auth_instance._exchange_code_for_token(query_params['code'][0])
+        except Exception as e:
+            # Hand the error to the thread waiting in _authenticate instead of letting it die with this one
+            auth_instance._auth_error = e
+            auth_instance._auth_event.set()
+            self.wfile.write(_AUTH_FAILED)
+        else:
+            self.wfile.write(_AUTH_OK)
+
+def install_fast_loop() -> bool:
+    """
+    Switches asyncio to uvloop's event loop policy, if uvloop is installed.
+    Call this before any event loop is created (e.g. before `asyncio.run`).
+
+    :return: True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+if os.getenv("TRADESTATION_UVLOOP") == "1":
+    install_fast_loop()
+
+class _LineBuffer:
+    """
+    Splits a chunked byte stream into newline-delimited records.
+    Consumed bytes are skipped with a read cursor and only compacted once they fill half the buffer,
+    so splitting a chunk into many short records does not shift the remaining bytes once per record.
+    """
+    def __init__(self):
+        self._pending = bytearray()
+        self._start = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Appends a chunk to the buffer and returns the complete, non-empty lines it finished."""
+        pending = self._pending
+        pending += chunk
+        start = self._start
+        lines = []
+        with memoryview(pending) as view:
+            while (end := pending.find(b'\n', start)) != -1:
+                line = bytes(view[start:end]).strip()
+                start = end + 1
+                if line:
+                    lines.append(line)
+        if start > len(pending) // 2:
+            del pending[:start]
+            start = 0
+        self._start = start
+        return lines
+
+    def flush(self) -> Optional[bytes]:
+        """Returns the trailing record left without a terminating newline, if any."""
+        line = bytes(self._pending[self._start:]).strip()
+        self._pending.clear()
+        self._start = 0
+        return line or None
+
+def _iso_utc(dt: datetime) -> str:
+    """Formats a datetime as an ISO-8601 UTC timestamp with second precision, e.g. '2024-01-02T15:30:00Z'."""
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+@lru_cache(maxsize=128)
+def _quote_ids(ids: str) -> str:
+    # Commas stay literal as the ID separator; anything else that is not URL-safe (e.g. "/") is escaped
+    return quote(ids, safe=",")
+
+@lru_cache(maxsize=128)
+def _join_ids(ids: Tuple[str, ...]) -> str:
+    return _quote_ids(",".join(ids))
+
+def _ids_key(ids: Union[str, List[str]]) -> str:
+    """Returns one or more IDs as an escaped, comma-separated URL path segment, memoized for repeatedly polled ID sets."""
+    if isinstance(ids, str):
+        return _quote_ids(ids)
+    return _join_ids(tuple(ids))
+
+def _id_chunks(ids: Union[str, List[str]]) -> List[str]:
+    """Splits IDs into path segments of at most `MAX_IDS_PER_REQUEST` IDs each, the most the API accepts in one request."""
+    if isinstance(ids, str):
+        if ids.count(",") < MAX_IDS_PER_REQUEST:
+            return [_quote_ids(ids)]
+        ids = ids.split(",")
+    if len(ids) <= MAX_IDS_PER_REQUEST:
+        return [_ids_key(ids)]
+    return [_ids_key(ids[i:i + MAX_IDS_PER_REQUEST]) for i in range(0, len(ids), MAX_IDS_PER_REQUEST)]
+
+def _stream_ids_key(ids: Union[str, List[str]]) -> str:
+    """
+    Returns the path segment for the IDs of a stream, which cannot be split across requests like a REST call.
+
+    :raises ValueError: If there are more than `MAX_IDS_PER_REQUEST` IDs.
+    """
+    chunks = _id_chunks(ids)
+    if len(chunks) > 1:
+        raise ValueError(f"At most {MAX_IDS_PER_REQUEST} IDs can be streamed at once.")
+    return chunks[0]
+
+def _merge_responses(responses: List[dict]) -> dict:
+    """Merges responses of requests split by `_id_chunks`, concatenating their lists (e.g. "Orders" and "Errors")."""
+    if len(responses) == 1:
+        return responses[0]
+    merged = {}
+    for response in responses:
+        for key, value in response.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+def _validate_choice(name: str, value: str, choices: frozenset):
+    """
+    Rejects values the API would refuse before any request is sent.
+
+    :raises ValueError: If `value` is not one of `choices`.
+    """
+    if value not in choices:
+        raise ValueError(f"Invalid {name} {value!r}. Must be one of: {', '.join(sorted(choices))}.")
+
+def _parse_stream_line(line: bytes) -> dict:
+    """Parses a single streamed JSON record."""
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        raise ValueError(f"Invalid JSON received: {line.decode(errors='replace')}")
+
+class StreamEvent(NamedTuple):
+    """A brokerage stream message tagged with its kind: "Data", "Heartbeat", "Error", "StreamStatus" or "Deleted"."""
+    kind: str
+    payload: dict
+
+def _stream_event(data: dict) -> StreamEvent:
+    """Tags a parsed brokerage stream message with its kind. An empty message becomes an "InvalidData" error."""
+    if not data:
+        return StreamEvent("Error", {"Error": "InvalidData", "Message": "Received empty data from the stream."})
+    for kind in ("Heartbeat", "Error", "StreamStatus", "Deleted"):
+        if kind in data:
+            return StreamEvent(kind, data)
+    return StreamEvent("Data", data)
+
+def _dispatch_stream_message(data: dict,
+                             data_handler: callable,
+                             error_handler: callable,
+                             heartbeat_handler: callable,
+                             status_handler: callable,
+                             deleted_handler: Optional[callable] = None):
+    """
+    Routes one parsed brokerage stream message to the handler for its kind, as classified by `_stream_event`,
+    and returns the handler's result. A `Deleted` message goes to `data_handler` if no `deleted_handler` is given.
+    Messages whose handler is None are ignored.
+    """
+    kind, payload = _stream_event(data)
+    handler = {"Data": data_handler,
+               "Heartbeat": heartbeat_handler,
+               "Error": error_handler,
+               "StreamStatus": status_handler,
+               "Deleted": deleted_handler if deleted_handler is not None else data_handler}[kind]
+    return handler(payload) if handler is not None else None
+
+_BACKPRESSURE_NOTICE = MappingProxyType({"Error": "Backpressure",
+                                         "Message": "Stream handlers are falling behind, dropping the oldest messages."})
+
+async def _adispatch_stream(data_generator: AsyncGenerator[dict, None],
+                            data_handler: callable,
+                            error_handler: callable,
+                            heartbeat_handler: callable,
+                            status_handler: callable,
+                            deleted_handler: Optional[callable] = None,
+                            drop_oldest: bool = True):
+    """
+    Dispatches stream messages from a separate task, so slow handlers do not stall reading from the socket.
+    Handlers may be coroutine functions; they are awaited one message at a time, in order.
+    Up to `STREAM_QUEUE_SIZE` messages are buffered. If `drop_oldest` is True and the handlers still have not caught up
+    once the reader yields, the oldest messages are dropped and `error_handler` (if given) receives a single
+    "Backpressure" error until they do. Otherwise reading pauses until there is room, and no message is lost.
+    """
+    queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    notify_backpressure = False
+
+    async def dispatch(data: dict):
+        result = _dispatch_stream_message(data, data_handler, error_handler, heartbeat_handler, status_handler, deleted_handler)
+        if inspect.isawaitable(result):
+            await result
+
+    async def consume():
+        nonlocal notify_backpressure
+        try:
+            while (data := await queue.get()) is not None:
+                # Delivered out of band, since a notice in the queue would itself be dropped while the overflow lasts
+                if notify_backpressure:
+                    notify_backpressure = False
+                    await dispatch(dict(_BACKPRESSURE_NOTICE))
+                await dispatch(data)
+        except BaseException:
+            # Wake a reader waiting for room, so it notices the failure instead of waiting forever
+            while not queue.empty():
+                queue.get_nowait()
+            raise
+
+    consumer = asyncio.create_task(consume())
+    overflowing = False
+    try:
+        async for data in data_generator:
+            if consumer.done():
+                break
+            if not drop_oldest:
+                await queue.put(data)
+                continue
+            if queue.full():
+                # A large chunk can hold more messages than the queue; give the consumer a turn before dropping any
+                await asyncio.sleep(0)
+            if queue.full():
+                queue.get_nowait()
+                if not overflowing:
+                    overflowing = notify_backpressure = True
+            elif queue.empty():
+                overflowing = False
+            queue.put_nowait(data)
+        if not consumer.done():
+            await queue.put(None)
+        # Re-raises any exception raised by a handler
+        await consumer
+    finally:
+        consumer.cancel()
+        await data_generator.aclose()
+
+def _bars_to_frame(bars: List[dict]):
+    """
+    Converts raw bar records into a columnar polars DataFrame with typed OHLCV columns.
+
+    :raises ImportError: If polars is not installed.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        raise ImportError("as_frame=True requires polars. Install it with `pip install tradestation[frames]`.")
+
+    frame = pl.from_dicts(bars, schema={column: pl.Utf8 for column in BAR_COLUMNS})
+    return frame.with_columns(
+        pl.col("TimeStamp").str.to_datetime(time_zone="UTC"),
+        pl.col("Open", "High", "Low", "Close").cast(pl.Float64),
+        pl.col("TotalVolume").cast(pl.Int64),
+    )
 
 class Order:
     """Represents an order for group order placement."""
+    __slots__ = ("account_id", "symbol", "quantity", "order_type", "trade_action", "time_in_force_duration",
+                 "time_in_force_expiration", "route", "limit_price", "stop_price", "add_liquidity", "all_or_none",
+                 "book_only", "discretionary_price", "market_activation_rules", "non_display", "peg_value",
+                 "show_only_quantity", "time_activation_rules", "trailing_stop", "buying_power_warning", "order_confirm_id")
+
     def __init__(self, account_id: str, symbol: str, quantity: str, order_type: Literal["Limit", "StopMarket", "Market", "StopLimit"],
                  trade_action: Literal["BUY", "SELL", "BUYTOCOVER", "SELLSHORT", "BUYTOOPEN", "BUYTOCLOSE", "SELLTOOPEN", "SELLTOCLOSE"],
                  time_in_force_duration: Literal["DAY", "DYP", "GTC", "GCP", "GTD", "GDP", "OPG", "CLO", "IOC", "FOK", "1", "3", "5"],
@@ -143,7 +422,7 @@ class Order:
             "Route": self.route
         }
         if self.time_in_force_expiration:
-            order_dict["TimeInForce"]["Expiration"] = self.time_in_force_expiration.replace(microsecond=0).astimezone(timezone.utc).isoformat()
+            order_dict["TimeInForce"]["Expiration"] = _iso_utc(self.time_in_force_expiration)
         if self.limit_price:
             order_dict["LimitPrice"] = self.limit_price
         if self.stop_price:
@@ -181,11 +460,56 @@ class Order:
 
         return order_dict
 
+# Weak references only, so registering for cleanup at exit does not keep clients alive
+_OPEN_CLIENTS = weakref.WeakSet()
+
+@atexit.register
+def _close_open_clients():
+    for client in list(_OPEN_CLIENTS):
+        client.close()
+
+def _weak_callback(method: callable) -> callable:
+    """
+    Wraps a bound method for a timer or event loop callback without keeping its instance alive.
+    Once the instance has been collected, the callback does nothing, so a dropped client's refresh chain ends.
+    """
+    ref = weakref.WeakMethod(method)
+
+    def callback(*args):
+        method = ref()
+        if method is not None:
+            method(*args)
+    return callback
+
 class TradeStation:
     """Handles authentication and API requests for TradeStation."""
     ### Initiation and Authentication handling ###
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, port: int = 8080,
-                 is_demo: bool = True, refresh_token_margin:float=60, async_mode: bool = False):
+                 is_demo: bool = True, refresh_token_margin:float=60, async_mode: bool = False,
+                 authenticate: bool = True, cache_ttls: Optional[dict] = None,
+                 pool_limits: httpx.Limits = HTTP_LIMITS, keepalive_interval: Optional[float] = None):
+        """
+        Initializes the client and, unless `authenticate` is False, runs the OAuth flow.
+
+        :param client_id: TradeStation API key. Defaults to the CLIENT_ID environment variable.
+        :param client_secret: TradeStation API secret. Defaults to the CLIENT_SECRET environment variable.
+        :param port: Local port for the OAuth redirect listener.
+        :param is_demo: Whether to use the simulation API instead of the live API.
+        :param refresh_token_margin: Seconds before expiry at which the access token is refreshed.
+        :param async_mode: Whether to authenticate with the asyncio-based listener.
+        :param authenticate: Whether to authenticate during construction. Use `acreate` to authenticate inside a running event loop.
+        :param cache_ttls: Optional mapping of GET endpoint to the number of seconds its response may be reused for,
+            e.g. `DEFAULT_CACHE_TTLS`. Routes and activation triggers are cached for an hour (`STATIC_CACHE_TTLS`)
+            unless overridden here; other endpoints not in the mapping are never cached.
+        :param pool_limits: Connection pool limits for the HTTP clients. Allow one keep-alive connection per concurrently
+            streamed account, plus headroom for bursts of order requests.
+        :param keepalive_interval: If set, seconds between lightweight requests that keep a pooled connection warm,
+            so an order sent after a quiet period does not pay for a new TLS handshake. Must be shorter than
+            `pool_limits.keepalive_expiry` (30 seconds by default), or the pool drops the connection between pings.
+        :raises ValueError: If `keepalive_interval` is not shorter than `pool_limits.keepalive_expiry`.
+        """
+        if keepalive_interval and pool_limits.keepalive_expiry is not None and keepalive_interval >= pool_limits.keepalive_expiry:
+            raise ValueError(f"keepalive_interval must be shorter than the pool's keepalive_expiry ({pool_limits.keepalive_expiry} seconds).")
         self.client_id = client_id if client_id else os.getenv('CLIENT_ID')
         self.client_secret = client_secret if client_secret else os.getenv('CLIENT_SECRET')
         assert self.client_id, "Either client_id or CLIENT_ID environment variable must be provided."
@@ -193,18 +517,67 @@ class TradeStation:
         self.port=port
         self.api_url = DEMO_API_URL if is_demo else LIVE_API_URL
         self.redirect_uri = f'http://localhost:{self.port}/'
+        self._auth_url = self._generate_auth_url()
         self.access_token = None
         self.refresh_token = None
         self.expires_in = None
         self.refresh_margin = timedelta(seconds=refresh_token_margin)
+        self._auth_event = threading.Event()
+        self._auth_error = None
+        self._server = None
+        self._refresh_timer = None
+        self._refresh_handle = None
+        self._refresh_task = None
+        self._refresh_at = None
+        self._refresh_lock = threading.Lock()
+        self._arefresh_lock = None
+        self._arefresh_lock_loop = None
+        self._client = None
+        self._aclient = None
+        self._aclient_loop = None
+        self._cache_ttls = {**STATIC_CACHE_TTLS, **(cache_ttls or {})}
+        self._cache = {}
+        self._pool_limits = pool_limits
+        self.keepalive_interval = keepalive_interval
+        self._keepalive_timer = None
+        self._keepalive_handle = None
+        self._keepalive_task = None
+        self._order_batch = []
+        self._order_batch_handle = None
+        self._order_batch_tasks = set()
+        _OPEN_CLIENTS.add(self)
+        if not authenticate:
+            return
         if async_mode:
-            self.auth_code_event = asyncio.Event()
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(self._async_authenticate())
+            asyncio.run(self._async_authenticate_and_close())
         else:
             self._authenticate()
-            
-        # self.refresh_task = loop.create_task(self._refresh_token_loop())
+            self._schedule_refresh()
+            self._schedule_keepalive()
+
+    @classmethod
+    async def acreate(cls, *args, **kwargs) -> "TradeStation":
+        """
+        Asynchronously creates an authenticated client and schedules its token refresh on the running event loop.
+        Use this instead of the constructor when an event loop is already running. Takes the same arguments as the constructor.
+        """
+        kwargs.pop("async_mode", None)
+        self = cls(*args, authenticate=False, **kwargs)
+        await self._async_authenticate()
+        await self.aschedule_refresh()
+        await self.aschedule_keepalive()
+        return self
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """The current OAuth access token."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]):
+        # Rebuild the default headers only when the token rotates, not on every request
+        self._access_token = value
+        self._auth_headers = MappingProxyType({"Authorization": f"Bearer {value}"}) if value else None
 
     def _generate_auth_url(self) -> str:
         """Generates the authentication URL for TradeStation OAuth."""
@@ -216,34 +589,58 @@ class TradeStation:
             'scope': 'openid profile offline_access MarketData ReadAccount Trade',
             'state': 'xyzv'  # Use a secure state to prevent CSRF attacks
         }
-        return f"https://signin.tradestation.com/authorize?{urlencode(params)}"
+        return f"{AUTH_URL}?{urlencode(params)}"
     
     def _start_server(self):
         """Starts a local HTTP server to handle OAuth callback."""
         OAuthHandler.access_token = None
-        server = HTTPServer(("127.0.0.1", self.port), OAuthHandler)
-        server.auth_instance = self
-        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._server = HTTPServer(("127.0.0.1", self.port), OAuthHandler)
+        self._server.auth_instance = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _stop_server(self):
+        """Stops the callback server and releases its listening socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
 
     async def _start_async_server(self):
-        app = web.Application()
-        app.router.add_get("/", self._handle_auth_redirect)
-        runner = web.AppRunner(app)
-        await runner.setup()
-        self.server = web.TCPSite(runner, "localhost", self.port)
-        await self.server.start()
+        """Starts a minimal loopback listener to handle the OAuth callback."""
+        self.server = await asyncio.start_server(self._handle_auth_redirect, "localhost", self.port)
 
     async def _stop_async_server(self):
-        await self.server.stop()
-
-    async def _handle_auth_redirect(self, request):
-        query = request.rel_url.query
-        code = query.get("code")
-        if code:
-            await self._async_exchange_code_for_token(code)
-            self.auth_code_event.set()
-            return web.Response(body=auth_success_html, content_type='text/html')
-        return web.Response(text="No authorization code found.")
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle_auth_redirect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Reads the OAuth redirect request, exchanges the received code and answers with a static page."""
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        # A malformed request line has no target, and is answered like a redirect without a code
+        parts = request.split(b" ", 2)
+        target = parts[1].decode("latin-1") if len(parts) == 3 else ""
+        code = parse_qs(urlparse(target).query).get("code")
+        try:
+            if code:
+                try:
+                    await self._async_exchange_code_for_token(code[0])
+                except Exception as e:
+                    if not self._auth_future.done():
+                        self._auth_future.set_exception(e)
+                    writer.write(_AUTH_FAILED)
+                else:
+                    if not self._auth_future.done():
+                        self._auth_future.set_result(None)
+                    writer.write(_AUTH_OK)
+            else:
+                writer.write(_AUTH_NO_CODE)
+            await writer.drain()
+        finally:
+            writer.close()
 
     def _exchange_code_for_token(self, code: str):
         """Exchanges authorization code for an access token."""
@@ -255,15 +652,8 @@ class TradeStation:
             'client_secret': self.client_secret
         }
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        with httpx.Client() as client:
-            response = client.post(TOKEN_URL, data=data, headers=headers)
-            if response.status_code == 200:
-                body = response.json()
-                self.access_token = body['access_token']
-                self.refresh_token = body['refresh_token']
-                self.token_expiry = datetime.now() + timedelta(seconds=body.get('expires_in', 1200))
-            else:
-                raise ValueError(f"Error obtaining token: {response.text}")
+        response = self._get_client().post(TOKEN_URL, data=data, headers=headers)
+        self._handle_token_response(response)
 
     async def _async_exchange_code_for_token(self, code:str):
         """Exchanges the authorization code for an access token."""
@@ -275,74 +665,373 @@ class TradeStation:
             'client_secret': self.client_secret
         }
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(TOKEN_URL, data=data, headers=headers)
-            if response.status_code == 200:
-                body = response.json()
-                self.access_token = body['access_token']
-                self.refresh_token = body['refresh_token']
-                self.token_expiry = datetime.now() + timedelta(seconds=body.get('expires_in', 1200))
-            else:
-                raise ValueError(f"Error obtaining token: {response.text}")
+        response = await self._get_async_client().post(TOKEN_URL, data=data, headers=headers)
+        self._handle_token_response(response)
+
+    def _get_client(self) -> httpx.Client:
+        """Returns the shared synchronous HTTP client, creating it on first use."""
+        if self._client is None:
+            transport = httpx.HTTPTransport(http2=True, retries=HTTP_RETRIES, limits=self._pool_limits)
+            self._client = httpx.Client(base_url=self.api_url, transport=transport, timeout=HTTP_TIMEOUT)
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared asynchronous HTTP client, creating it on first use.
+        Pooled connections are bound to the event loop that opened them, so a new client is created
+        whenever this is called from a different loop (e.g. across separate `asyncio.run` calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            transport = httpx.AsyncHTTPTransport(http2=True, retries=HTTP_RETRIES, limits=self._pool_limits)
+            self._aclient = httpx.AsyncClient(base_url=self.api_url, transport=transport, timeout=HTTP_TIMEOUT)
+            self._aclient_loop = loop
+        return self._aclient
+
+    def _get_arefresh_lock(self) -> asyncio.Lock:
+        """
+        Returns the lock that coalesces concurrent async token refreshes, created on the running loop.
+        Before Python 3.10 an asyncio.Lock binds the current loop when it is created, so it cannot be built in `__init__`
+        (which may run in a thread without a loop, or before `asyncio.run` creates one).
+        """
+        loop = asyncio.get_running_loop()
+        if self._arefresh_lock is None or self._arefresh_lock_loop is not loop:
+            self._arefresh_lock = asyncio.Lock()
+            self._arefresh_lock_loop = loop
+        return self._arefresh_lock
+
+    def close(self):
+        """Closes the shared synchronous HTTP client and cancels any scheduled token refresh or keep-alive ping."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if self._keepalive_timer:
+            self._keepalive_timer.cancel()
+            self._keepalive_timer = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Closes the shared asynchronous HTTP client and cancels any scheduled token refresh or keep-alive ping."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        if self._keepalive_handle:
+            self._keepalive_handle.cancel()
+            self._keepalive_handle = None
+        if self._keepalive_task and self._keepalive_task is not asyncio.current_task():
+            self._keepalive_task.cancel()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __enter__(self) -> "TradeStation":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self) -> "TradeStation":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        self.close()
+
+    def _handle_token_response(self, response: httpx.Response):
+        """
+        Stores the tokens returned by the token endpoint and signals any thread waiting on authentication.
+
+        :param response: The response received from the token endpoint.
+        :raises ValueError: If the token request failed.
+        """
+        if response.status_code != 200:
+            raise ValueError(f"Error obtaining token: {response.text}")
+        body = orjson.loads(response.content)
+        self.access_token = body['access_token']
+        self.refresh_token = body.get('refresh_token', self.refresh_token)
+        self.expires_in = body.get('expires_in', 1200)
+        # Wall-clock expiry is kept for display only; scheduling uses the monotonic clock, which NTP steps cannot move
+        self.token_expiry = datetime.now() + timedelta(seconds=self.expires_in)
+        self._refresh_at = time.monotonic() + self.expires_in - self.refresh_margin.total_seconds()
+        self._auth_event.set()
+
+    def _refresh_delay(self) -> float:
+        """Returns the number of seconds to wait before refreshing the current access token."""
+        return max(self._refresh_at - time.monotonic(), 0.0)
+
+    def _schedule_refresh(self, delay: Optional[float] = None):
+        """
+        Schedules a background thread to refresh the access token shortly before it expires.
+
+        :param delay: Seconds to wait before refreshing. Defaults to the time left before the token expires.
+        """
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+        if delay is None:
+            delay = self._refresh_delay()
+        self._refresh_timer = threading.Timer(delay, _weak_callback(self._on_refresh_timer))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _on_refresh_timer(self):
+        # A failed refresh must not end the chain, or the token silently expires
+        try:
+            self._refresh_access_token()
+        except (httpx.HTTPError, ValueError) as e:
+            # close() clears the timer, so a refresh that was already running does not reschedule itself
+            if self._refresh_timer is not None:
+                print(f"Token refresh failed, retrying in {REFRESH_RETRY_DELAY} seconds: {e}")
+                self._schedule_refresh(REFRESH_RETRY_DELAY)
+
+    async def aschedule_refresh(self, delay: Optional[float] = None):
+        """
+        Schedules a refresh of the access token on the running event loop shortly before it expires.
+        Each refresh schedules the next one, keeping the token valid for as long as the loop runs.
+
+        :param delay: Seconds to wait before refreshing. Defaults to the time left before the token expires.
+        """
+        loop = asyncio.get_running_loop()
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+        if delay is None:
+            delay = self._refresh_delay()
+        self._refresh_handle = loop.call_later(delay, _weak_callback(self._on_refresh_due))
+
+    def _on_refresh_due(self):
+        self._refresh_task = asyncio.get_running_loop().create_task(self._arefresh_and_reschedule())
+
+    async def _arefresh_and_reschedule(self):
+        try:
+            await self._arefresh_access_token()
+        except (httpx.HTTPError, ValueError) as e:
+            if self._refresh_handle is not None:
+                print(f"Token refresh failed, retrying in {REFRESH_RETRY_DELAY} seconds: {e}")
+                await self.aschedule_refresh(REFRESH_RETRY_DELAY)
+            return
+        if self._refresh_handle is not None:
+            await self.aschedule_refresh()
 
-    async def _refresh_token_loop(self) -> None:
-        """
-        Periodically refreshes the access token before it expires.
+    def _schedule_keepalive(self):
+        """Schedules a background thread to ping the API after `keepalive_interval` seconds, if set."""
+        if not self.keepalive_interval:
+            return
+        if self._keepalive_timer:
+            self._keepalive_timer.cancel()
+        self._keepalive_timer = threading.Timer(self.keepalive_interval, _weak_callback(self._keepalive_ping))
+        self._keepalive_timer.daemon = True
+        self._keepalive_timer.start()
+
+    def _keepalive_ping(self):
+        try:
+            self._get_client().get(KEEPALIVE_ENDPOINT, headers=self._auth_headers)
+        except httpx.HTTPError:
+            pass
+        # close() clears the timer, so a ping that was already running does not reschedule itself
+        if self._keepalive_timer is not None:
+            self._schedule_keepalive()
 
-        :raises ValueError: If no refresh token is available or the refresh request fails.
+    async def aschedule_keepalive(self):
         """
-        while True:
-            if not self.refresh_token:
-                print("No refresh token available.")
-                return
+        Schedules a ping of the API on the running event loop after `keepalive_interval` seconds, if set.
+        Each ping schedules the next one, keeping a pooled connection warm for as long as the loop runs.
+        """
+        if not self.keepalive_interval:
+            return
+        loop = asyncio.get_running_loop()
+        if self._keepalive_handle:
+            self._keepalive_handle.cancel()
+        self._keepalive_handle = loop.call_later(self.keepalive_interval, _weak_callback(self._on_keepalive_due))
+
+    def _on_keepalive_due(self):
+        self._keepalive_task = asyncio.get_running_loop().create_task(self._akeepalive_ping())
+
+    async def _akeepalive_ping(self):
+        try:
+            await self._get_async_client().get(KEEPALIVE_ENDPOINT, headers=self._auth_headers)
+        except httpx.HTTPError:
+            pass
+        if self._keepalive_handle is not None:
+            await self.aschedule_keepalive()
 
-            now = datetime.now()
-            refresh_in = self.token_expiry - now - self.refresh_margin
-            refresh_in = max(refresh_in.seconds, 0)
-            print(f"Refreshing token in {refresh_in:.1f} seconds")
-            await asyncio.sleep(refresh_in)
-            print("Refreshing access token...")
-            await self._refresh_access_token()
-    
-    async def _refresh_access_token(self) -> None:
+    def _refresh_token_data(self) -> dict:
         """
-        Refreshes the access token using the refresh token.
+        Builds the form data for a refresh token request.
 
-        :raises ValueError: If no refresh token is available or the refresh request fails.
+        :raises ValueError: If no refresh token is available.
         """
         if not self.refresh_token:
             raise ValueError("No refresh token available")
-        
-        data = {
+
+        return {
             'grant_type': 'refresh_token',
             'client_id': self.client_id,
             'client_secret': self.client_secret,
             'refresh_token': self.refresh_token
         }
-        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        response = await self._asend_request(url=TOKEN_URL, data=data, headers=headers)
-        if response.status_code == 200:
-            body = response.json()
-            self.access_token = body['access_token']
-            self.token_expiry = datetime.now() + timedelta(seconds=body.get('expires_in', 1200))
-        else:
-            raise ValueError(f"Error refreshing token: {response.text}")
+
+    def _refresh_access_token(self) -> None:
+        """
+        Refreshes the access token using the refresh token and, unless the client has been closed, schedules the next refresh.
+        Concurrent callers are coalesced: whoever waited on the lock returns once the token has been replaced.
+
+        :raises ValueError: If no refresh token is available or the refresh request fails.
+        """
+        stale_token = self.access_token
+        with self._refresh_lock:
+            if self.access_token != stale_token:
+                return
+            data = self._refresh_token_data()
+            headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+            response = self._get_client().post(TOKEN_URL, data=data, headers=headers)
+            self._handle_token_response(response)
+            if self._refresh_timer is not None:
+                self._schedule_refresh()
+
+    async def _arefresh_access_token(self) -> None:
+        """
+        Asynchronously refreshes the access token using the refresh token.
+        Concurrent callers are coalesced: whoever waited on the lock returns once the token has been replaced.
+
+        :raises ValueError: If no refresh token is available or the refresh request fails.
+        """
+        stale_token = self.access_token
+        async with self._get_arefresh_lock():
+            if self.access_token != stale_token:
+                return
+            data = self._refresh_token_data()
+            headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+            response = await self._get_async_client().post(TOKEN_URL, data=data, headers=headers)
+            self._handle_token_response(response)
 
     def _authenticate(self):
-        """Handles the authentication flow."""
+        """
+        Handles the authentication flow.
+
+        :raises TimeoutError: If the user does not complete the login within `AUTH_TIMEOUT` seconds.
+        :raises ValueError: If exchanging the authorization code for a token fails.
+        """
+        self._auth_event.clear()
+        self._auth_error = None
         self._start_server()
-        webbrowser.open(self._generate_auth_url())
-        
-        while self.access_token is None:
-            pass
+        try:
+            webbrowser.open(self._auth_url)
+            if not self._auth_event.wait(timeout=AUTH_TIMEOUT):
+                raise TimeoutError(f"Authentication was not completed within {AUTH_TIMEOUT} seconds.")
+        finally:
+            # Releases the callback port on success, failure and timeout alike
+            self._stop_server()
+        if self._auth_error is not None:
+            error, self._auth_error = self._auth_error, None
+            raise error
 
     async def _async_authenticate(self):
+        self._auth_future = asyncio.get_running_loop().create_future()
         await self._start_async_server()
-        webbrowser.open(self._generate_auth_url())
+        webbrowser.open(self._auth_url)
         # Wait for the first auth to complete
-        await self.auth_code_event.wait()
-        await self._stop_async_server()
+        try:
+            await self._auth_future
+        finally:
+            await self._stop_async_server()
+
+    async def _async_authenticate_and_close(self):
+        """
+        Authenticates on the temporary loop created by the constructor in `async_mode`, then closes the async
+        client bound to that loop so it is not left open after `asyncio.run` returns.
+        """
+        try:
+            await self._async_authenticate()
+        finally:
+            await self.aclose()
     
+    def _build_request(self,
+                       client: Union[httpx.Client, httpx.AsyncClient],
+                       endpoint: Optional[str] = None,
+                       url: Optional[str] = None,
+                       params: Optional[dict] = None,
+                       method: Literal['GET', 'POST', 'PUT', 'DELETE'] = 'GET',
+                       headers: Optional[dict] = None,
+                       payload: Optional[dict] = None,
+                       timeout: Union[int, float, httpx.Timeout] = HTTP_TIMEOUT) -> httpx.Request:
+        """
+        Builds a request to the TradeStation API. Shared by the sync and async transports so both send identical requests.
+
+        :param client: The client that will send the request.
+        :param endpoint: The API endpoint to send the request to, relative to the client's API base URL.
+            Either `endpoint` or `url` must be provided.
+        :param url: The full URL to send the request to. Overrides `endpoint` if provided.
+        :param params: Query parameters to include in the request.
+        :param method: HTTP method to use for the request. Valid values are 'GET', 'POST', 'PUT', 'DELETE'.
+        :param headers: Optional headers to include in the request. If not provided, default headers with authorization will be used.
+        :param payload: Optional JSON payload to include in the request body.
+        :param timeout: Timeout for the request in seconds.
+        :return: The prepared request.
+        :raises ValueError: If neither `endpoint` nor `url` is provided.
+        """
+        url = url or endpoint
+        if not url:
+            raise ValueError("Either endpoint or url must be provided.")
+        headers = headers or self._auth_headers
+        content = None
+        if payload is not None:
+            content = orjson.dumps(payload)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        return client.build_request(method, url, headers=headers, params=params, content=content, timeout=timeout)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> dict:
+        """
+        Returns the JSON body of a successful response.
+
+        :raises ValueError: If the request failed.
+        """
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        raise ValueError(f"Request failed with status code {response.status_code} and message: \"{response.text}\"")
+
+    def _cache_key(self, method: str, endpoint: Optional[str], params: Optional[dict], headers: Optional[dict]) -> Optional[tuple]:
+        """Returns the response cache key for a request, or None if the request is not cacheable."""
+        if method != 'GET' or headers is not None or endpoint not in self._cache_ttls:
+            return None
+        return endpoint, tuple(sorted(params.items())) if params else ()
+
+    def _cache_get(self, key: Optional[tuple]) -> Optional[dict]:
+        """Returns a fresh copy of a cached response that has not expired yet."""
+        if key is None:
+            return None
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return orjson.loads(hit[1])
+        return None
+
+    def _cache_put(self, key: Optional[tuple], response: httpx.Response) -> dict:
+        """
+        Parses a response and caches its raw body for its endpoint's TTL, evicting the oldest entries beyond
+        `CACHE_MAX_ENTRIES`. Only the body is kept, so callers that mutate the returned dict cannot alter the cache.
+
+        :raises ValueError: If the request failed.
+        """
+        data = self._parse_response(response)
+        if key is not None:
+            self._cache.pop(key, None)
+            self._cache[key] = (time.monotonic() + self._cache_ttls[key[0]], response.content)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+        return data
+
+    def clear_cache(self):
+        """Drops all cached GET responses."""
+        self._cache.clear()
+
+    def refresh_routes(self):
+        """Drops the cached routes and activation triggers, so the next call fetches them again."""
+        for key in [key for key in self._cache if key[0] in STATIC_CACHE_TTLS]:
+            self._cache.pop(key, None)
+
     def _send_request(self, 
                       endpoint: str, 
                       params: Optional[dict] = None, 
@@ -360,15 +1049,13 @@ class TradeStation:
         :return: A dictionary containing the JSON response from the API.
         :raises ValueError: If the request fails or invalid data is received.
         """
-        url = f"{self.api_url}/{endpoint}"
-        if not headers:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-        with httpx.Client() as client:
-            response = client.request(method, url, headers=headers, params=params, json=payload)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise ValueError(f"Request failed with status code {response.status_code} and message: \"{response.text}\"")
+        key = self._cache_key(method, endpoint, params, headers)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        client = self._get_client()
+        request = self._build_request(client, endpoint, params=params, method=method, headers=headers, payload=payload)
+        return self._cache_put(key, client.send(request))
 
     async def _asend_request(self, 
                              endpoint: Optional[str] = None, 
@@ -389,20 +1076,13 @@ class TradeStation:
         :return: A dictionary containing the JSON response from the API.
         :raises ValueError: If the request fails or invalid parameters are provided.
         """
-        if not url:
-            if not endpoint:
-                raise ValueError("Either endpoint or url must be provided.")
-            url = f"{self.api_url}/{endpoint}"
-
-        if not headers and self.access_token:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-
-        async with httpx.AsyncClient() as client:
-            response = await client.request(method, url, headers=headers, params=params, json=payload)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise ValueError(f"Request failed with status code {response.status_code} and message: \"{response.text}\"")
+        key = None if url else self._cache_key(method, endpoint, params, headers)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        client = self._get_async_client()
+        request = self._build_request(client, endpoint, url=url, params=params, method=method, headers=headers, payload=payload)
+        return self._cache_put(key, await client.send(request))
 
     def _stream_request(self, 
                         endpoint: str, 
@@ -423,22 +1103,23 @@ class TradeStation:
         :return: A generator yielding parsed JSON data from the stream.
         :raises ValueError: If the request fails or invalid data is received.
         """
-        url = f"{self.api_url}/{endpoint}"
-        if not headers and self.access_token:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-
-        with httpx.stream(method, url, headers=headers, params=params, json=payload, timeout=timeout) as response:
-            if response.status_code == 200:
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            yield data
-                        except json.JSONDecodeError:
-                            raise ValueError(f"Invalid JSON received: {line}")
-            else:
-                raise ValueError(f"Request failed with status code {response.status_code} and message: \"{response.read().decode()}\"")
-    
+        client = self._get_client()
+        request = self._build_request(client, endpoint, params=params, method=method, headers=headers, payload=payload, timeout=timeout)
+        response = client.send(request, stream=True)
+        try:
+            if response.status_code != 200:
+                response.read()
+                self._parse_response(response)
+            buffer = _LineBuffer()
+            for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                for line in buffer.feed(chunk):
+                    yield _parse_stream_line(line)
+            line = buffer.flush()
+            if line:
+                yield _parse_stream_line(line)
+        finally:
+            response.close()
+
     async def _astream_request(self, 
                                endpoint: str, 
                                params: Optional[dict] = None, 
@@ -458,25 +1139,88 @@ class TradeStation:
         :return: An asynchronous generator yielding parsed JSON data from the stream.
         :raises ValueError: If the request fails or invalid data is received.
         """
-        url = f"{self.api_url}/{endpoint}"
-        if not headers and self.access_token:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-        
-        async with httpx.AsyncClient() as client:
-            async with client.stream(method, url, headers=headers, params=params, json=payload, timeout=timeout) as response:
-                if response.status_code == 200:
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                data = json.loads(line)
-                                yield data
-                            except json.JSONDecodeError:
-                                raise ValueError(f"Invalid JSON received: {line}")
-                else:
-                    raise ValueError(f"Request failed with status code {response.status_code} and message: \"{await response.aread()}\"")
+        client = self._get_async_client()
+        request = self._build_request(client, endpoint, params=params, method=method, headers=headers, payload=payload, timeout=timeout)
+        response = await client.send(request, stream=True)
+        try:
+            if response.status_code != 200:
+                await response.aread()
+                self._parse_response(response)
+            buffer = _LineBuffer()
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                for line in buffer.feed(chunk):
+                    yield _parse_stream_line(line)
+            line = buffer.flush()
+            if line:
+                yield _parse_stream_line(line)
+        finally:
+            await response.aclose()
+
+    async def abatch(self, *calls: Union[str, Tuple[str, Optional[dict]]]) -> list:
+        """
+        Sends several GET requests concurrently over the shared client and returns their responses in order.
+        Preferred over sequential awaits when refreshing several views at once (e.g. accounts, balances and positions).
+
+        :param calls: Endpoints to request, either as a plain endpoint string or an `(endpoint, params)` tuple.
+        :return: A list of JSON responses, in the same order as `calls`.
+        :raises ValueError: If any of the requests fails.
+        """
+        calls = [(call, None) if isinstance(call, str) else call for call in calls]
+        return await asyncio.gather(*(self._asend_request(endpoint, params=params) for endpoint, params in calls))
 
     ### Market Data ###
-    
+
+    @staticmethod
+    def _bars_params(interval: int,
+                     unit: str,
+                     bars_back: Optional[int],
+                     first_date: Optional[datetime],
+                     last_date: Optional[datetime],
+                     session_template: str) -> dict:
+        """
+        Builds the query parameters for a historical bars request, omitting unset values.
+
+        :raises ValueError: If both `bars_back` and `first_date` are provided, or `unit` or `session_template` is invalid.
+        """
+        _validate_choice("unit", unit, BAR_UNITS)
+        _validate_choice("session_template", session_template, SESSION_TEMPLATES)
+        if bars_back and first_date:
+            raise ValueError("bars_back and first_date should be mutually exclusive. Choose one.")
+        if not bars_back and not first_date:
+            bars_back = 1
+
+        params = (
+            ('interval', interval),
+            ('unit', unit),
+            ('sessiontemplate', session_template),
+            ('firstdate', _iso_utc(first_date) if first_date else None),
+            ('barsback', None if first_date else bars_back),
+            ('lastdate', _iso_utc(last_date) if last_date else None),
+        )
+        return {key: value for key, value in params if value is not None}
+
+    @staticmethod
+    def _stream_bars_params(interval: int,
+                            unit: str,
+                            bars_back: Optional[int],
+                            session_template: str) -> dict:
+        """
+        Builds the query parameters for a bar stream, rejecting out-of-range values before the stream is opened.
+
+        :raises ValueError: If `interval` or `bars_back` is out of range, or `unit` or `session_template` is invalid.
+        """
+        _validate_choice("unit", unit, BAR_UNITS)
+        _validate_choice("session_template", session_template, SESSION_TEMPLATES)
+        if not (1 <= interval <= 64999):
+            raise ValueError("Interval must be between 1 and 64999 ticks.")
+        if bars_back and not (1 <= bars_back <= 57600):
+            raise ValueError("BarsBack must be between 1 and 57600.")
+
+        params = {'interval': interval, 'unit': unit, 'sessiontemplate': session_template}
+        if bars_back:
+            params['barsback'] = bars_back
+        return params
+
     def get_bars(self, 
                  symbol: str, 
                  interval: int = 1, 
@@ -484,26 +1228,16 @@ class TradeStation:
                  bars_back: Optional[int] = None, 
                  first_date: Optional[datetime] = None, 
                  last_date: Optional[datetime] = None,
-                 session_template: Literal['USEQPre', 'USEQPost', 'USEQPreAndPost', 'USEQ24Hour', 'Default'] = 'Default'):
-        """Fetches historical market data bars from TradeStation."""
-        if bars_back and first_date:
-            raise ValueError("bars_back and first_date should be mutually exclusive. Choose one.")
-        if not bars_back and not first_date:
-            bars_back = 1
-        
-        params = {
-            'interval': interval,
-            'unit': unit,
-            'sessiontemplate': session_template
-        }
-        if first_date:
-            params['firstdate'] = first_date.replace(microsecond=0).astimezone(timezone.utc).isoformat()
-        else:
-            params['barsback'] = bars_back
-        
-        if last_date:
-            params['lastdate'] = last_date.replace(microsecond=0).astimezone(timezone.utc).isoformat()
-        return self._send_request(f"marketdata/barcharts/{symbol}", params).get('Bars', [])
+                 session_template: Literal['USEQPre', 'USEQPost', 'USEQPreAndPost', 'USEQ24Hour', 'Default'] = 'Default',
+                 as_frame: bool = False):
+        """
+        Fetches historical market data bars from TradeStation.
+
+        :param as_frame: If True, returns a polars DataFrame with typed OHLCV columns instead of the raw list of bars.
+        """
+        params = self._bars_params(interval, unit, bars_back, first_date, last_date, session_template)
+        bars = self._send_request(f"marketdata/barcharts/{symbol}", params=params).get('Bars', [])
+        return _bars_to_frame(bars) if as_frame else bars
 
     async def aget_bars(self, 
                         symbol: str, 
@@ -512,27 +1246,34 @@ class TradeStation:
                         bars_back: Optional[int] = None, 
                         first_date: Optional[datetime] = None, 
                         last_date: Optional[datetime] = None,
-                        session_template: Literal['USEQPre', 'USEQPost', 'USEQPreAndPost', 'USEQ24Hour', 'Default'] = 'Default'):
-        """Fetches historical market data bars from TradeStation."""
-        if bars_back and first_date:
-            raise ValueError("bars_back and first_date should be mutually exclusive. Choose one.")
-        if not bars_back and not first_date:
-            bars_back = 1
-        
-        params = {
-            'interval': interval,
-            'unit': unit,
-            'sessiontemplate': session_template
-        }
-        if first_date:
-            params['firstdate'] = first_date.replace(microsecond=0).astimezone(timezone.utc).isoformat()
-        else:
-            params['barsback'] = bars_back
-        
-        if last_date:
-            params['lastdate'] = last_date.replace(microsecond=0).astimezone(timezone.utc).isoformat()
-        res = await self._asend_request(f"marketdata/barcharts/{symbol}", params)
-        return res.get('Bars', [])
+                        session_template: Literal['USEQPre', 'USEQPost', 'USEQPreAndPost', 'USEQ24Hour', 'Default'] = 'Default',
+                        as_frame: bool = False):
+        """
+        Fetches historical market data bars from TradeStation.
+
+        :param as_frame: If True, returns a polars DataFrame with typed OHLCV columns instead of the raw list of bars.
+        """
+        params = self._bars_params(interval, unit, bars_back, first_date, last_date, session_template)
+        res = await self._asend_request(f"marketdata/barcharts/{symbol}", params=params)
+        bars = res.get('Bars', [])
+        return _bars_to_frame(bars) if as_frame else bars
+
+    async def aget_bars_many(self, symbols: List[str], max_concurrency: int = 32, **kwargs) -> dict:
+        """
+        Fetches historical bars for several symbols concurrently over the shared client.
+
+        :param symbols: The symbols to fetch bars for.
+        :param max_concurrency: Maximum number of requests in flight at once.
+        :param kwargs: Arguments forwarded to `aget_bars` for every symbol.
+        :return: A dictionary mapping each symbol to its bars.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(symbol: str):
+            async with semaphore:
+                return symbol, await self.aget_bars(symbol, **kwargs)
+
+        return dict(await asyncio.gather(*(fetch(symbol) for symbol in symbols)))
 
     def stream_tick_bars(self,
                          symbol: str, 
@@ -553,20 +1294,8 @@ class TradeStation:
             - Tick bar data: Actual tick bar data for the specified symbol.
         """
 
-        # Validate inputs
-        if not (1 <= interval <= 64999):
-            raise ValueError("Interval must be between 1 and 64999 ticks.")
-        if bars_back and not (1 <= bars_back <= 57600):
-            raise ValueError("BarsBack must be between 1 and 57600.")
+        params = self._stream_bars_params(interval, unit, bars_back, session_template)
 
-        params = {
-            "interval":interval,
-            "unit":unit,
-            'sessiontemplate': session_template
-        }
-        if bars_back:
-            params['barsback'] = bars_back
-        
         return self._stream_request(f"marketdata/stream/barcharts/{symbol}", params=params)
     
     async def astream_tick_bars(self,
@@ -587,20 +1316,7 @@ class TradeStation:
         :param bars_back: Number of bars to retrieve.
         """
 
-        # Validate inputs
-        if not (1 <= interval <= 64999):
-            raise ValueError("Interval must be between 1 and 64999 ticks.")
-        if bars_back and not (1 <= bars_back <= 57600):
-            raise ValueError("BarsBack must be between 1 and 57600.")
-
-        # Construct the HTTP SSE URL
-        params = {
-            "interval": interval,
-            "unit": unit,
-            "sessiontemplate": session_template
-        }
-        if bars_back:
-            params["barsback"] = bars_back
+        params = self._stream_bars_params(interval, unit, bars_back, session_template)
 
         data_generator = self._astream_request(f"marketdata/stream/barcharts/{symbol}", params=params)
         if not data_handler:
@@ -632,16 +1348,12 @@ class TradeStation:
 
     def get_balances(self, accounts:Union[str, List[str]]):
         """Fetches account balances for the specified accounts."""
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
         return self._send_request(f"brokerage/accounts/{accounts}/balances")
     
     async def aget_balances(self, accounts:Union[str, List[str]]):
         """Fetches account balances for the specified accounts asynchronously."""
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
         return await self._asend_request(f"brokerage/accounts/{accounts}/balances")
     
     def get_orders(self, accounts:Union[str, List[str]]):
@@ -651,9 +1363,7 @@ class TradeStation:
         Request valid for all account types.
         """
 
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
         return self._send_request(f"brokerage/accounts/{accounts}/orders")
     
     async def aget_orders(self, accounts:Union[str, List[str]]):
@@ -662,38 +1372,30 @@ class TradeStation:
         sorted in descending order of time placed for open and time executed for closed.
         Request valid for all account types.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
         return await self._asend_request(endpoint=f"brokerage/accounts/{accounts}/orders")
     
     def get_order_by_id(self, accounts:Union[str, List[str]], order_ids:Union[str, List[str]]):
         """
         Fetches today's orders and open orders for the given Accounts, 
         filtered by given Order IDs, sorted in descending order of time placed for open and time executed for closed.
-        Request valid for all account types.
+        Request valid for all account types. More than `MAX_IDS_PER_REQUEST` Order IDs are fetched in several requests
+        whose results are concatenated, so ordering only holds within each group of IDs.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        if isinstance(order_ids, str):
-            order_ids = [order_ids] 
-        accounts = ",".join(accounts)
-        order_ids= ",".join(order_ids)
-        return self._send_request(f"brokerage/accounts/{accounts}/orders/{order_ids}")
+        accounts = _ids_key(accounts)
+        return _merge_responses([self._send_request(f"brokerage/accounts/{accounts}/orders/{chunk}")
+                                 for chunk in _id_chunks(order_ids)])
     
     async def aget_order_by_id(self, accounts:Union[str, List[str]], order_ids:Union[str, List[str]]):
         """
         Asynchronously fetches today's orders and open orders for the given Accounts, 
         filtered by given Order IDs, sorted in descending order of time placed for open and time executed for closed.
-        Request valid for all account types.
+        Request valid for all account types. More than `MAX_IDS_PER_REQUEST` Order IDs are fetched in concurrent requests
+        whose results are concatenated, so ordering only holds within each group of IDs.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        if isinstance(order_ids, str):
-            order_ids = [order_ids] 
-        accounts = ",".join(accounts)
-        order_ids= ",".join(order_ids)
-        return await self._asend_request(f"brokerage/accounts/{accounts}/orders/{order_ids}")
+        accounts = _ids_key(accounts)
+        return _merge_responses(await asyncio.gather(*(self._asend_request(f"brokerage/accounts/{accounts}/orders/{chunk}")
+                                                       for chunk in _id_chunks(order_ids))))
 
     def get_positions(self, accounts: Union[str, List[str]], symbol: Optional[Union[str, List[str]]] = None):
         """
@@ -702,15 +1404,11 @@ class TradeStation:
         :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
         :param symbol: Optional. List of valid symbols in comma-separated format. Supports wildcards for filtering.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
         params = {}
         if symbol:
-            if isinstance(symbol, str):
-                symbol = [symbol]
-            params['symbol'] = ",".join(symbol)
+            params['symbol'] = symbol if isinstance(symbol, str) else ",".join(symbol)
 
         return self._send_request(f"brokerage/accounts/{accounts}/positions", params=params)
 
@@ -721,27 +1419,42 @@ class TradeStation:
         :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
         :param symbol: Optional. List of valid symbols in comma-separated format. Supports wildcards for filtering.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
         params = {}
         if symbol:
-            if isinstance(symbol, str):
-                symbol = [symbol]
-            params['symbol'] = ",".join(symbol)
+            params['symbol'] = symbol if isinstance(symbol, str) else ",".join(symbol)
 
         return await self._asend_request(f"brokerage/accounts/{accounts}/positions", params=params)
 
+    async def aget_account_snapshot(self, accounts: Union[str, List[str]],
+                                    order_ids: Optional[Union[str, List[str]]] = None) -> dict:
+        """
+        Asynchronously fetches balances, orders and positions for the given Accounts concurrently,
+        so the snapshot costs a single round trip instead of three.
+
+        :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
+        :param order_ids: Optional. List of Order IDs to fetch instead of all of today's and open orders.
+        :return: A dictionary with the "Balances", "Orders" and "Positions" responses from the TradeStation API.
+        """
+        orders = self.aget_order_by_id(accounts, order_ids) if order_ids else self.aget_orders(accounts)
+        balances, orders, positions = await asyncio.gather(self.aget_balances(accounts),
+                                                           orders,
+                                                           self.aget_positions(accounts))
+        return {"Balances": balances, "Orders": orders, "Positions": positions}
+
     async def astream_positions(self, accounts: Union[str, List[str]], 
                                  changes: bool = False,
                                  data_handler: Optional[callable] = None, 
                                  error_handler: Optional[callable] = None,
                                  heartbeat_handler: Optional[callable] = None,
                                  status_handler: Optional[callable] = None,
-                                 deleted_handler: Optional[callable] = None) -> Union[AsyncGenerator[dict, None], None]:
+                                 deleted_handler: Optional[callable] = None,
+                                 drop_oldest: bool = True) -> Union[AsyncGenerator[dict, None], None]:
         """
         Streams positions for the given accounts asynchronously. Request valid for Cash, Margin, Futures, and DVP account types.
+        Handlers run in a separate task, so a slow handler does not stall reading from the socket, and may be coroutine
+        functions. An exception raised by a handler ends the stream and is re-raised here once the next message arrives.
         :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
         :param changes: Boolean value to specify whether to stream updates as changes.
         :param data_handler: Function to handle incoming position data.
@@ -749,38 +1462,41 @@ class TradeStation:
         :param heartbeat_handler: Function to handle heartbeat messages.
         :param status_handler: Function to handle stream status messages.
         :param deleted_handler: Function to handle deleted messages.
-        :return: An asynchronous generator yielding parsed JSON data from the stream, the data can be one of the following:
+        :param drop_oldest: Whether to drop the oldest buffered messages once the handlers fall `STREAM_QUEUE_SIZE`
+            messages behind. `error_handler` then receives a single {"Error": "Backpressure"} message each time dropping
+            starts. If False, reading from the stream pauses until the handlers catch up, and no message is lost.
+        :return: If no `data_handler` is given, an asynchronous generator yielding parsed JSON data from the stream,
+            without any buffering or dropping. The data can be one of the following:
             - "Heartbeat": Heartbeat message indicating the stream is alive.
             - "Error": Error message indicating an issue with the stream.
             - "StreamStatus": Status message indicating the current state of the stream.
             - "Deleted": Message indicating that a position has been deleted.
             - Position data: Actual position data for the specified accounts.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
         params = {"changes": str(changes).lower()}
 
         data_generator = self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/positions", params=params)
         if not data_handler:
             return data_generator
-        async for data in self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/positions", params=params):
-            if data:
-                if "Heartbeat" in data:
-                    heartbeat_handler(data)
-                elif "Error" in data:
-                    error_handler(data)
-                elif "StreamStatus" in data:
-                    status_handler(data)
-                elif "Deleted" in data:
-                    deleted_handler(data)
+        await _adispatch_stream(data_generator, data_handler, error_handler, heartbeat_handler, status_handler, deleted_handler,
+                                drop_oldest)
 
-                else:
-                    data_handler(data)
-            else:
-                error_handler({"Error": "InvalidData",
-                               "Message": "Received empty data from the stream."})
+    async def astream_positions_iter(self, accounts: Union[str, List[str]], changes: bool = False) -> AsyncGenerator[StreamEvent, None]:
+        """
+        Streams positions for the given accounts as tagged events, without any handler callbacks.
+        Request valid for Cash, Margin, Futures, and DVP account types.
+
+        :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
+        :param changes: Boolean value to specify whether to stream updates as changes.
+        :return: An asynchronous generator yielding `StreamEvent(kind, payload)` tuples, where kind is one of
+            "Data", "Heartbeat", "Error", "StreamStatus" or "Deleted".
+        """
+        accounts = _ids_key(accounts)
+        params = {"changes": str(changes).lower()}
+        async for data in self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/positions", params=params):
+            yield _stream_event(data)
 
     def stream_positions(self, accounts: Union[str, List[str]], 
                          changes: bool = False,
@@ -800,68 +1516,49 @@ class TradeStation:
         :param status_handler: Function to handle stream status messages.
         :param deleted_handler: Function to handle deleted messages.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
         params = {"changes": str(changes).lower()}
 
         for data in self._stream_request(endpoint=f"brokerage/stream/accounts/{accounts}/positions", params=params):
-            if data:
-                if "Heartbeat" in data:
-                    heartbeat_handler(data)
-                elif "Error" in data:
-                    error_handler(data)
-                elif "StreamStatus" in data:
-                    status_handler(data)
-                elif "Deleted" in data:
-                    deleted_handler(data)
-                else:
-                    data_handler(data)
-            else:
-                error_handler({"Error": "InvalidData",
-                               "Message": "Received empty data from the stream."})
+            _dispatch_stream_message(data, data_handler, error_handler, heartbeat_handler, status_handler, deleted_handler)
 
     async def astream_orders(self, accounts: Union[str, List[str]], 
                             data_handler=print, 
                             error_handler=print, 
                             heartbeat_handler=lambda x: None,
-                            status_handler=print):
+                            status_handler=print,
+                            drop_oldest: bool = False):
         """
         Streams orders for the given accounts. Request valid for Cash, Margin, Futures, and DVP account types.
+        Handlers run in a separate task, so a slow handler does not stall reading from the socket, and may be coroutine
+        functions. An exception raised by a handler ends the stream and is re-raised here once the next message arrives.
 
         :param accounts: List of valid Account IDs for the authenticated user.
         :param data_handler: Function to handle incoming order data.
         :param error_handler: Function to handle errors.
         :param heartbeat_handler: Function to handle heartbeat messages.
         :param status_handler: Function to handle stream status messages.
+        :param drop_oldest: Whether to drop the oldest buffered messages once the handlers fall `STREAM_QUEUE_SIZE`
+            messages behind. `error_handler` then receives a single {"Error": "Backpressure"} message each time dropping
+            starts. If False, reading from the stream pauses until the handlers catch up, and no message is lost.
+            Defaults to False, since a dropped message may be a fill or status update.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
-        async for data in self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders"):
-            if data:
-                try:
-                    if "Heartbeat" in data:
-                        heartbeat_handler(data)
-                    elif "Error" in data:
-                        error_handler(data)
-                    elif "StreamStatus" in data:
-                        status_handler(data)
-                    else:
-                        data_handler(data)
-                except json.JSONDecodeError:
-                    error_handler({"Error": "InvalidJSON",
-                                   "Message": f"The received data is not a valid JSON: \"{data}\""})
+        await _adispatch_stream(self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders"),
+                                data_handler, error_handler, heartbeat_handler, status_handler, drop_oldest=drop_oldest)
 
     async def astream_orders_by_id(self, accounts: Union[str, List[str]], order_ids: Union[str, List[str]], 
                                   data_handler=print, 
                                   error_handler=print, 
                                   heartbeat_handler=lambda x: None,
-                                  status_handler=print):
+                                  status_handler=print,
+                                  drop_oldest: bool = False):
         """
         Streams orders for the given accounts and order IDs. Request valid for Cash, Margin, Futures, and DVP account types.
+        Handlers run in a separate task, so a slow handler does not stall reading from the socket, and may be coroutine
+        functions. An exception raised by a handler ends the stream and is re-raised here once the next message arrives.
 
         :param accounts: List of valid Account IDs for the authenticated user in comma-separated format.
         :param order_ids: List of valid Order IDs for the account IDs in comma-separated format.
@@ -869,28 +1566,16 @@ class TradeStation:
         :param error_handler: Function to handle errors.
         :param heartbeat_handler: Function to handle heartbeat messages.
         :param status_handler: Function to handle stream status messages.
+        :param drop_oldest: Whether to drop the oldest buffered messages once the handlers fall `STREAM_QUEUE_SIZE`
+            messages behind. `error_handler` then receives a single {"Error": "Backpressure"} message each time dropping
+            starts. If False, reading from the stream pauses until the handlers catch up, and no message is lost.
+            Defaults to False, since a dropped message may be a fill or status update.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        if isinstance(order_ids, str):
-            order_ids = [order_ids]
-        accounts = ",".join(accounts)
-        order_ids = ",".join(order_ids)
+        accounts = _ids_key(accounts)
+        order_ids = _stream_ids_key(order_ids)
 
-        async for data in self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders/{order_ids}"):
-            if data:
-                try:
-                    if "Heartbeat" in data:
-                        heartbeat_handler(data)
-                    elif "Error" in data:
-                        error_handler(data)
-                    elif "StreamStatus" in data:
-                        status_handler(data)
-                    else:
-                        data_handler(data)
-                except json.JSONDecodeError:
-                    error_handler({"Error": "InvalidJSON",
-                                   "Message": f"The received data is not a valid JSON: \"{data}\""})
+        await _adispatch_stream(self._astream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders/{order_ids}"),
+                                data_handler, error_handler, heartbeat_handler, status_handler, drop_oldest=drop_oldest)
 
     def stream_orders(self, accounts: Union[str, List[str]], 
                       data_handler=print, 
@@ -906,19 +1591,10 @@ class TradeStation:
         :param heartbeat_handler: Function to handle heartbeat messages.
         :param status_handler: Function to handle stream status messages.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        accounts = ",".join(accounts)
+        accounts = _ids_key(accounts)
 
         for data in self._stream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders"):
-            if "Heartbeat" in data:
-                heartbeat_handler(data)
-            elif "Error" in data:
-                error_handler(data)
-            elif "StreamStatus" in data:
-                status_handler(data)
-            else:
-                data_handler(data)
+            _dispatch_stream_message(data, data_handler, error_handler, heartbeat_handler, status_handler)
 
     def stream_orders_by_id(self, accounts: Union[str, List[str]], order_ids: Union[str, List[str]], 
                             data_handler=print, 
@@ -934,22 +1610,11 @@ class TradeStation:
         :param error_handler: Function to handle errors.
         :param heartbeat_handler: Function to handle heartbeat messages.
         """
-        if isinstance(accounts, str):
-            accounts = [accounts]
-        if isinstance(order_ids, str):
-            order_ids = [order_ids]
-        accounts = ",".join(accounts)
-        order_ids = ",".join(order_ids)
+        accounts = _ids_key(accounts)
+        order_ids = _stream_ids_key(order_ids)
 
         for data in self._stream_request(endpoint=f"brokerage/stream/accounts/{accounts}/orders/{order_ids}"):
-            if "Heartbeat" in data:
-                heartbeat_handler(data)
-            elif "Error" in data:
-                error_handler(data)
-            elif "StreamStatus" in data:
-                status_handler(data)
-            else:
-                data_handler(data)
+            _dispatch_stream_message(data, data_handler, error_handler, heartbeat_handler, status_handler)
 
     ### Order execution services ###
 
@@ -1001,6 +1666,73 @@ class TradeStation:
         }
         return await self._asend_request(method="POST", endpoint="brokerage/accounts/ordergroups", payload=payload)
 
+    async def aplace_order_batched(self, order: Order) -> dict:
+        """
+        Asynchronously places an order together with any others submitted within `ORDER_BATCH_WAIT` seconds,
+        sending up to `ORDER_BATCH_SIZE` of them as one NORMAL group order, so a burst of orders costs a single request.
+
+        Orders batched together are not independent: if the group request is rejected, or the API reports errors
+        that cannot be attributed to individual orders, every order in the batch fails with the same error,
+        including orders that were valid on their own (and, for a partial failure, may have been placed anyway;
+        the error includes the full group response). Use `aplace_order` for orders that must not depend on others.
+
+        :param order: An Order object representing the order to be placed.
+        :return: Response for this order alone, in the same form as `aplace_order`: {"Orders": [<entry for this order>]}.
+        :raises ValueError: If the group request fails or this order is rejected.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._order_batch.append((order, future))
+        if len(self._order_batch) >= ORDER_BATCH_SIZE:
+            self._flush_order_batch()
+        elif self._order_batch_handle is None:
+            self._order_batch_handle = loop.call_later(ORDER_BATCH_WAIT, self._flush_order_batch)
+        return await future
+
+    def _flush_order_batch(self):
+        if self._order_batch_handle:
+            self._order_batch_handle.cancel()
+            self._order_batch_handle = None
+        batch, self._order_batch = self._order_batch, []
+        if batch:
+            # Keep a reference so the task is not garbage collected before it completes
+            task = asyncio.get_running_loop().create_task(self._asend_order_batch(batch))
+            self._order_batch_tasks.add(task)
+            task.add_done_callback(self._order_batch_tasks.discard)
+
+    async def _asend_order_batch(self, batch: List[Tuple[Order, asyncio.Future]]):
+        try:
+            response = await self.aplace_group_order("NORMAL", [order for order, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), outcome in zip(batch, self._split_group_response(response, len(batch))):
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+    @staticmethod
+    def _split_group_response(response: dict, size: int) -> List[Union[dict, ValueError]]:
+        """
+        Splits a group order response into one result per submitted order, in submission order.
+        Entries are matched by position, so they can only be attributed when the API returns one entry per order.
+        """
+        orders = response.get("Orders") or []
+        errors = response.get("Errors") or []
+        if not errors and len(orders) == size:
+            return [{"Orders": [entry]} for entry in orders]
+        if not orders and len(errors) == size:
+            return [ValueError(f"Order rejected: {error}") for error in errors]
+        # Some orders of the group may still have been placed; the full response lets callers reconcile them
+        error = ValueError(f"Order group partially failed and its results cannot be attributed to individual orders; "
+                           f"some orders may have been placed: {response}")
+        return [error] * size
+
     def confirm_order(self, order: Order):
         """
         Confirms an order and returns estimated cost and commission information.
@@ -1049,29 +1781,13 @@ class TradeStation:
         }
         return await self._asend_request(method="POST", endpoint="brokerage/accounts/ordergroupconfirm", payload=payload)
 
-    def replace_order(self, order_id: str, quantity: Optional[str] = None, limit_price: Optional[str] = None,
-                      stop_price: Optional[str] = None, order_type: Optional[Literal["Market"]] = None,
-                      show_only_quantity: Optional[str] = None, trailing_stop_amount: Optional[str] = None,
-                      trailing_stop_percent: Optional[str] = None, market_activation_clear_all: Optional[bool] = None,
-                      market_activation_rules: Optional[List[dict]] = None, time_activation_clear_all: Optional[bool] = None,
-                      time_activation_rules: Optional[List[datetime]] = None):
-        """
-        Replaces an active order with a modified version of that order.
-
-        :param order_id: The ID of the order to replace.
-        :param quantity: The new quantity for the order.
-        :param limit_price: The new limit price for the order.
-        :param stop_price: The new stop price for the order.
-        :param order_type: The new order type. Can only be updated to "Market".
-        :param show_only_quantity: Hides the true number of shares intended to be bought or sold.
-        :param trailing_stop_amount: Trailing stop offset in currency.
-        :param trailing_stop_percent: Trailing stop offset in percentage.
-        :param market_activation_clear_all: If True, removes all market activation rules.
-        :param market_activation_rules: List of market activation rules.
-        :param time_activation_clear_all: If True, removes all time activation rules.
-        :param time_activation_rules: List of datetime objects for time activation rules.
-        :return: Response from the TradeStation API.
-        """
+    @staticmethod
+    def _build_replace_payload(quantity: Optional[str], limit_price: Optional[str], stop_price: Optional[str],
+                               order_type: Optional[str], show_only_quantity: Optional[str],
+                               trailing_stop_amount: Optional[str], trailing_stop_percent: Optional[str],
+                               market_activation_clear_all: Optional[bool], market_activation_rules: Optional[List[dict]],
+                               time_activation_clear_all: Optional[bool], time_activation_rules: Optional[List[datetime]]) -> dict:
+        """Builds the request body for replacing an order, including only the fields being changed."""
         payload = {}
         if quantity:
             payload["Quantity"] = quantity
@@ -1082,32 +1798,62 @@ class TradeStation:
         if order_type:
             payload["OrderType"] = order_type
 
+        # Price-chasing replacements usually only change prices, so skip building advanced options entirely
+        if not (show_only_quantity or trailing_stop_amount or trailing_stop_percent or market_activation_rules
+                or time_activation_rules or market_activation_clear_all is not None or time_activation_clear_all is not None):
+            return payload
+
         advanced_options = {}
         if show_only_quantity:
             advanced_options["ShowOnlyQuantity"] = show_only_quantity
         if trailing_stop_amount or trailing_stop_percent:
-            advanced_options["TrailingStop"] = {}
+            trailing_stop = advanced_options["TrailingStop"] = {}
             if trailing_stop_amount:
-                advanced_options["TrailingStop"]["Amount"] = trailing_stop_amount
+                trailing_stop["Amount"] = trailing_stop_amount
             if trailing_stop_percent:
-                advanced_options["TrailingStop"]["Percent"] = trailing_stop_percent
+                trailing_stop["Percent"] = trailing_stop_percent
         if market_activation_clear_all is not None or market_activation_rules:
-            advanced_options["MarketActivationRules"] = {}
+            market_rules = advanced_options["MarketActivationRules"] = {}
             if market_activation_clear_all is not None:
-                advanced_options["MarketActivationRules"]["ClearAll"] = market_activation_clear_all
+                market_rules["ClearAll"] = market_activation_clear_all
             if market_activation_rules:
-                advanced_options["MarketActivationRules"]["Rules"] = market_activation_rules
+                market_rules["Rules"] = market_activation_rules
         if time_activation_clear_all is not None or time_activation_rules:
-            advanced_options["TimeActivationRules"] = {}
+            time_rules = advanced_options["TimeActivationRules"] = {}
             if time_activation_clear_all is not None:
-                advanced_options["TimeActivationRules"]["ClearAll"] = time_activation_clear_all
+                time_rules["ClearAll"] = time_activation_clear_all
             if time_activation_rules:
-                advanced_options["TimeActivationRules"]["Rules"] = [
-                    {"TimeUtc": rule.replace(microsecond=0).astimezone(timezone.utc).isoformat()} for rule in time_activation_rules
-                ]
+                time_rules["Rules"] = [{"TimeUtc": _iso_utc(rule)} for rule in time_activation_rules]
 
-        if advanced_options:
-            payload["AdvancedOptions"] = advanced_options
+        payload["AdvancedOptions"] = advanced_options
+        return payload
+
+    def replace_order(self, order_id: str, quantity: Optional[str] = None, limit_price: Optional[str] = None,
+                      stop_price: Optional[str] = None, order_type: Optional[Literal["Market"]] = None,
+                      show_only_quantity: Optional[str] = None, trailing_stop_amount: Optional[str] = None,
+                      trailing_stop_percent: Optional[str] = None, market_activation_clear_all: Optional[bool] = None,
+                      market_activation_rules: Optional[List[dict]] = None, time_activation_clear_all: Optional[bool] = None,
+                      time_activation_rules: Optional[List[datetime]] = None):
+        """
+        Replaces an active order with a modified version of that order.
+
+        :param order_id: The ID of the order to replace.
+        :param quantity: The new quantity for the order.
+        :param limit_price: The new limit price for the order.
+        :param stop_price: The new stop price for the order.
+        :param order_type: The new order type. Can only be updated to "Market".
+        :param show_only_quantity: Hides the true number of shares intended to be bought or sold.
+        :param trailing_stop_amount: Trailing stop offset in currency.
+        :param trailing_stop_percent: Trailing stop offset in percentage.
+        :param market_activation_clear_all: If True, removes all market activation rules.
+        :param market_activation_rules: List of market activation rules.
+        :param time_activation_clear_all: If True, removes all time activation rules.
+        :param time_activation_rules: List of datetime objects for time activation rules.
+        :return: Response from the TradeStation API.
+        """
+        payload = self._build_replace_payload(quantity, limit_price, stop_price, order_type, show_only_quantity,
+                                              trailing_stop_amount, trailing_stop_percent, market_activation_clear_all,
+                                              market_activation_rules, time_activation_clear_all, time_activation_rules)
 
         return self._send_request(method="PUT", endpoint=f"brokerage/accounts/orders/{order_id}", payload=payload)
 
@@ -1134,42 +1880,9 @@ class TradeStation:
         :param time_activation_rules: List of datetime objects for time activation rules.
         :return: Response from the TradeStation API.
         """
-        payload = {}
-        if quantity:
-            payload["Quantity"] = quantity
-        if limit_price:
-            payload["LimitPrice"] = limit_price
-        if stop_price:
-            payload["StopPrice"] = stop_price
-        if order_type:
-            payload["OrderType"] = order_type
-
-        advanced_options = {}
-        if show_only_quantity:
-            advanced_options["ShowOnlyQuantity"] = show_only_quantity
-        if trailing_stop_amount or trailing_stop_percent:
-            advanced_options["TrailingStop"] = {}
-            if trailing_stop_amount:
-                advanced_options["TrailingStop"]["Amount"] = trailing_stop_amount
-            if trailing_stop_percent:
-                advanced_options["TrailingStop"]["Percent"] = trailing_stop_percent
-        if market_activation_clear_all is not None or market_activation_rules:
-            advanced_options["MarketActivationRules"] = {}
-            if market_activation_clear_all is not None:
-                advanced_options["MarketActivationRules"]["ClearAll"] = market_activation_clear_all
-            if market_activation_rules:
-                advanced_options["MarketActivationRules"]["Rules"] = market_activation_rules
-        if time_activation_clear_all is not None or time_activation_rules:
-            advanced_options["TimeActivationRules"] = {}
-            if time_activation_clear_all is not None:
-                advanced_options["TimeActivationRules"]["ClearAll"] = time_activation_clear_all
-            if time_activation_rules:
-                advanced_options["TimeActivationRules"]["Rules"] = [
-                    {"TimeUtc": rule.replace(microsecond=0).astimezone(timezone.utc).isoformat()} for rule in time_activation_rules
-                ]
-
-        if advanced_options:
-            payload["AdvancedOptions"] = advanced_options
+        payload = self._build_replace_payload(quantity, limit_price, stop_price, order_type, show_only_quantity,
+                                              trailing_stop_amount, trailing_stop_percent, market_activation_clear_all,
+                                              market_activation_rules, time_activation_clear_all, time_activation_rules)
 
         return await self._asend_request(method="PUT", endpoint=f"brokerage/accounts/orders/{order_id}", payload=payload)
 